@@ -18,9 +18,16 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 @author: pyprg
 """
-import re
+try:
+    # optional faster engine, install with graphparser[fast]
+    import regex as re
+except ModuleNotFoundError:
+    import re
+from io import StringIO
+from sys import intern
 from operator import itemgetter
-from functools import reduce
+from functools import lru_cache
+from heapq import merge
 from itertools import chain
 from collections import namedtuple
 
@@ -45,22 +52,45 @@ ENTITY = (
     f'(?<!{ATTRIBUTE_KEY_CLASS}{KEY_VALUE_SEP}){ENTITY_ID}'
     f'(?!{KEY_VALUE_SEP}{ATTRIBUTE_VALUE_CLASS})')
 ATTRIBUTES = (
-    f'(({ATTRIBUTE_KEY}{KEY_VALUE_SEP}{ATTRIBUTE_VALUE}'
-    f'[{ATTRIBUTE_SEP}]?)+)')
-ALL = f'{BLANK}|{COMMENT}|{ATTRIBUTES}|{ENTITY}'
+    f'(?:{ATTRIBUTE_KEY}{KEY_VALUE_SEP}{ATTRIBUTE_VALUE}'
+    f'[{ATTRIBUTE_SEP}]?)+')
+# possessive repetition '(?:...)++' gives up no repetitions once matched
+# which rules out backtracking blow-ups on malformed attribute lines,
+# the matched text is identical as nothing follows the group; supported
+# by the 'regex' module and by stdlib 're' since Python 3.11, older
+# engines fall back to the backtracking form
+try:
+    re.compile(ATTRIBUTES + '+')
+    _ATTRIBUTES = ATTRIBUTES + '+'
+except re.error:
+    _ATTRIBUTES = ATTRIBUTES
+# alternation of all non-blank categories with named groups, one pass of
+# LINE.finditer scans a complete line, m.lastgroup carries the category
+LINE = f'(?P<comment>{COMMENT})|(?P<attr>{_ATTRIBUTES})|(?P<entity>{ENTITY})'
 
 # compiled regular expressions
 RE_ATTRIBUTE_SEP = re.compile(f'[{ATTRIBUTE_SEP}]')
 RE_KEY_VALUE_SEP = re.compile(KEY_VALUE_SEP)
 RE_BLANK = re.compile(BLANK)
 RE_COMMENT = re.compile(COMMENT)
-RE_ATTRIBUTES = re.compile(ATTRIBUTES)
+RE_ATTRIBUTES = re.compile(_ATTRIBUTES)
 RE_ENTITY = re.compile(ENTITY)
-RE_ALL = re.compile(ALL)
+RE_LINE = re.compile(LINE)
+
+# pre-bound methods of compiled patterns, saves one global plus one
+# attribute lookup per call in the per-line scanning functions
+_match_blank = RE_BLANK.match
+_finditer_line = RE_LINE.finditer
 
 _empty_tuple = ()
 _empty_dict = {}
 
+# deletes all ASCII non-word characters, a line translating to the empty
+# string consists of [\s\W] characters only and therefore is blank
+_DELETE_NON_WORD = str.maketrans(
+    '', '',
+    ''.join(c for c in map(chr, range(128)) if not (c.isalnum() or c=='_')))
+
 def _make_att_dict(match):
     """Creates a dict of attribute_name: attribute_value {str: str} from
     an re.Match.
@@ -73,49 +103,57 @@ def _make_att_dict(match):
     -------
     dict
         {str: str}"""
-    atts = RE_ATTRIBUTE_SEP.split(match.group(0).rstrip(ATTRIBUTE_SEP))
-    return dict(RE_KEY_VALUE_SEP.split(att) for att in atts)
-
-def _line_attributes(firstmatch):
+    # the matched text complies with ATTRIBUTES, keys and values contain
+    # no separator characters and exactly one '=' stands between them,
+    # str.split suffices and is cheaper than another regular expression
+    return dict(
+        pair.split('=', 1)
+        for pair in match.group(0).replace(',', ' ').split())
+
+def _line_attributes(firstmatch, matches):
     """Extracts attributes (key-value pairs) from a text line.
 
     Parameters
     ----------
     firstmatch: re.Match
-        first match of regular expression in processed line
+        first match of RE_LINE in processed line
+    matches: iterator
+        re.Match, rest of RE_LINE matches in processed line
 
-    Yields
-    ------
-    list
+    Returns
+    -------
+    tuple
         tuple
             * int pos_x
             * dict, key->value"""
-    start, end = firstmatch.span()
-    yield start, _make_att_dict(firstmatch)
-    for m in RE_ATTRIBUTES.finditer(firstmatch.string[end:]):
-         yield end + m.span()[0], _make_att_dict(m)
+    atts = [(firstmatch.start(), _make_att_dict(firstmatch))]
+    atts.extend(
+        (m.start(), _make_att_dict(m))
+        for m in matches if m.lastgroup == 'attr')
+    return tuple(atts)
 
-def _line_entities(firstmatch):
+def _line_entities(firstmatch, matches):
     """Extracts entities (nodes) from a text line.
 
     Parameters
     ----------
     firstmatch: re.Match
-        first match of regular expression in processed line
+        first match of RE_LINE in processed line
+    matches: iterator
+        re.Match, rest of RE_LINE matches in processed line
 
     Returns
     -------
-    list
+    tuple
         tuple
             * int, int, tuple pos_x, pos_y
             * str, id of entity"""
-    start, end = firstmatch.span()
     entities = [(firstmatch.span(), firstmatch.group(0))]
     entities.extend(
-        (((end + m2.span()[0]), (end + m2.span()[1])), m2.group(0))
-        for m2 in RE_ENTITY.finditer(firstmatch.string[firstmatch.span()[1]:]))
-    return entities
+        (m.span(), m.group(0)) for m in matches if m.lastgroup == 'entity')
+    return tuple(entities)
 
+@lru_cache(maxsize=2048)
 def _scanoneline(oneline):
     """Scans one line of a string. Determins the data category
     ::
@@ -135,15 +173,27 @@ def _scanoneline(oneline):
     tuple
         * str, category marker 'c'|'a'|'e'|'b'
         * category specific payload"""
-    m = RE_ALL.search(oneline)
-    if m:
-        if RE_COMMENT.match(m.group()):
-            return 'c', oneline
-        if RE_ATTRIBUTES.match(m.group()):
-            return 'a', _line_attributes(m)
-        if RE_ENTITY.match(m.group()):
-            return 'e', _line_entities(m)
-    return 'b', m.group()
+    if not oneline:
+        return 'b', oneline
+    if oneline[0] == '#':
+        # lines streamed from StringIO keep their terminator, the
+        # comment text is returned verbatim - strip the newline so
+        # already-split input and multiline strings yield the same
+        # payload
+        return 'c', oneline.rstrip('\n')
+    residue = oneline.translate(_DELETE_NON_WORD)
+    if not residue:
+        return 'b', oneline
+    if not residue.isascii() and _match_blank(oneline):
+        # residue of non-ASCII characters, the regular expression decides
+        return 'b', oneline
+    matches = _finditer_line(oneline)
+    firstmatch = next(matches, None)
+    if firstmatch is None:
+        return 'b', oneline
+    if firstmatch.lastgroup == 'attr':
+        return 'a', _line_attributes(firstmatch, matches)
+    return 'e', _line_entities(firstmatch, matches)
 
 def _scanlines(lines):
     """Scans a sequence (iterable) of strings.
@@ -155,38 +205,43 @@ def _scanlines(lines):
 
     Yields
     ------
-    dict
-        * 'entities': list
+    tuple
+        * entities: tuple|None
             tuple - (start, end), id_of_entity
-        * 'atts': list
-            tuple - start, ({key:value, ...}, ...)"""
+            None marks a comment
+        * atts|comment: list|str
+            list per attribute line, position-sorted
+                tuple - start, ({key:value, ...}, ...)
+            or str for a comment
+        * row: int"""
     entities = None
     atts = list()
     for row, line in enumerate(lines):
         marker, data = _scanoneline(line)
         if marker == 'b':
             if entities:
-                yield {'entities':entities, 'atts':atts, 'row':row}
+                yield entities, atts, row
             atts = list()
             entities = None
         elif marker == 'a':
-            atts.extend(data)
+            atts.append(data)
         elif marker == 'e':
             if entities is not None:
+                line_ = line.rstrip('\n')
                 msg = (
                     "unexpected entity (node), "
                     "lines with entities (nodes) must be "
                     "separated by 'blank' lines, processed line: "
-                    f"{row+1}:{line}")
+                    f"{row+1}:{line_}")
                 raise ValueError(msg)
             entities = data
         elif marker == 'c':
-            yield {'comment':data, 'row':row}
+            yield None, data, row
     if entities:
-        yield {'entities':entities, 'atts':atts, 'row':row}
+        yield entities, atts, row
 
 def _scanentities(lines):
-    """Scans a sequence (iterable) of strings.
+    """Scans a sequence (iterable) of strings for entities (nodes).
 
     Parameters
     ----------
@@ -195,56 +250,14 @@ def _scanentities(lines):
 
     Yields
     ------
-    dict
-        * 'entities': list
-            tuple - (start, end), id_of_entity
-        * 'atts': list
-            tuple - start, ({key:value, ...}, ...)"""
-    entities = None
-    atts = list()
+    tuple
+        tuple
+            * str, id of entity
+            * tuple - int, int (pos_x, -index_of_row)"""
     for idx, line in enumerate(lines):
         marker, data = _scanoneline(line)
         if marker == 'e':
             yield tuple((t[1], (t[0][0], -idx)) for t in data)
-    if entities:
-        yield {'entities': entities, 'atts': atts}
-
-def _get_positions(posl, posr, l_connect, r_connect):
-    """Corrects position of start by +1 if not connected at left side,
-    end position by -1 if not connected at right side.
-
-    Parameters
-    ----------
-    posl: int
-        start position
-    posr: int
-        end position
-    l_connect: bool
-        connected at left side?
-    r_connect: bool
-        connected at right side?
-
-    Returns
-    -------
-    tuple
-        int, int (start position, end position)"""
-    return posl if l_connect else posl + 1, posr if r_connect else posr - 1
-
-def _get_connect(e_id):
-    """Checks if given entity shall be connected to left/right adjacent
-    entity.
-
-    Parameters
-    ----------
-    e_id: str
-        string of entity-ID
-
-    Returns
-    -------
-    tuple
-        * bool, connects to left neighbour
-        * bool, connects to right neighbour"""
-    return not e_id.startswith('_'), not e_id.endswith('_')
 
 def strip_id(e_id, l_connect, r_connect):
     """Removes leading/trailing character when l_connect/r_connect.
@@ -267,6 +280,31 @@ def strip_id(e_id, l_connect, r_connect):
         # strip one leading and one trailing underscore
         e_id[0 if l_connect else 1:None if r_connect else -1])
 
+# lookup tables indexed by the 2-bit code (l_connect << 1) | r_connect,
+# strip one leading underscore if not l_connect, one trailing if not
+# r_connect, move start/end position towards the centre accordingly
+_STRIP_SLICES = (
+    slice(1, -1), slice(1, None), slice(None, -1), slice(None, None))
+_POS_OFFSETS = ((1, -1), (1, 0), (0, -1), (0, 0))
+
+def _parse_id(e_id):
+    """Checks connections of given entity to left/right adjacent entity and
+    strips leading/trailing underscore. Fuses '_get_connect' and 'strip_id'
+    into direct character tests.
+
+    Parameters
+    ----------
+    e_id: str
+        string of entity-ID
+
+    Returns
+    -------
+    tuple
+        * str, stripped e_id
+        * int, 2-bit code (l_connect << 1) | r_connect"""
+    code = ((e_id[:1] != '_') << 1) | (e_id[-1:] != '_')
+    return e_id[_STRIP_SLICES[code]], code
+
 def _correct_id_pos(e_id, poss):
     """Corrects position and strips id in case of leading/trailing underscore
 
@@ -282,10 +320,9 @@ def _correct_id_pos(e_id, poss):
     tuple
         * str, ID
         * tuple int, int (start position, end position)"""
-    l_connect, r_connect = _get_connect(e_id)
-    return (
-        strip_id(e_id, l_connect, r_connect),
-        _get_positions(*poss, l_connect, r_connect))
+    stripped, code = _parse_id(e_id)
+    dl, dr = _POS_OFFSETS[code]
+    return stripped, (poss[0] + dl, poss[1] + dr)
 
 def _add_connects(poss, e_id):
     """Leading/trailing underscore means no connection to left/right.
@@ -305,41 +342,11 @@ def _add_connects(poss, e_id):
         * str, ID
         * bool, left connection?
         * bool, right connection?"""
-    l_connect, r_connect = _get_connect(e_id)
+    stripped, code = _parse_id(e_id)
+    dl, dr = _POS_OFFSETS[code]
     return (
-        _get_positions(*poss, l_connect, r_connect),
-        (strip_id(e_id, l_connect, r_connect),
-         l_connect,
-         r_connect))
-
-def _neighbourids(infos):
-    """Returns IDs of left/right nodes connected by an edge to current node.
-
-    Parameters
-    ----------
-    info: array_like
-        tuple (str, bool, bool), (ID, connects_l, connects_r)
-
-    Returns
-    -------
-    tuple
-        str"""
-    # info: tuple(ID, connects_l, connects_r)
-    l_info = infos[-3] if 2 < len(infos) else None
-    r_info = infos[-1]
-    c_info = infos[-2]
-    l_connected = c_info[1] and (l_info[2] if l_info else False)
-    r_connected = c_info[2] and r_info[1]
-    if l_connected:
-        return (l_info[0], r_info[0]) if r_connected else (l_info[0],)
-    elif r_connected:
-        return r_info[0],
-    return _empty_tuple
-
-def _leftneighbourid(info):
-    """Returns a tuple of one ID if a left neighbour exists else
-    returns an empty tuple."""
-    return (info[0],) if info[2] else _empty_tuple
+        (poss[0] + dl, poss[1] + dr),
+        (stripped, code >> 1, code & 1))
 
 def _insert_edges(entities):
     """Adds edge tuples in the sequence of nodes. '_' on left/right side of ID
@@ -360,22 +367,34 @@ def _insert_edges(entities):
         * data of node or edge
         * ..."""
     pre_poss, pre_info = _add_connects(*entities[0])
-    other_infos = [pre_info]
+    prepre_info = None
     for e_poss, e_info in (_add_connects(*e) for e in entities[1:]):
-        other_infos.append(e_info)
-        yield pre_poss, 'node', pre_info[0], _neighbourids(other_infos)
-        if pre_info[2] and e_info[1]:
+        # info: tuple(ID, connects_l, connects_r)
+        l_connected = pre_info[1] and (prepre_info[2] if prepre_info else False)
+        r_connected = pre_info[2] and e_info[1]
+        if l_connected:
+            neighbours = (
+                (prepre_info[0], e_info[0]) if r_connected
+                else (prepre_info[0],))
+        elif r_connected:
+            neighbours = e_info[0],
+        else:
+            neighbours = _empty_tuple
+        yield pre_poss, 'node', pre_info[0], neighbours
+        if r_connected:
             start = pre_poss[1]
             end = e_poss[0]
             yield (start, end), 'edge', (pre_info[0], e_info[0])
+        prepre_info = pre_info
         pre_poss = e_poss
         pre_info = e_info
     yield (
         pre_poss,
         'node',
         pre_info[0],
-        (_leftneighbourid(other_infos[-2])
-         if (pre_info[1] and 1 < len(other_infos)) else _empty_tuple))
+        ((prepre_info[0],)
+         if (pre_info[1] and prepre_info is not None and prepre_info[2])
+         else _empty_tuple))
 
 def _get_collect_atts(atts):
     """Creates a function returning attributes for a given interval of
@@ -390,13 +409,13 @@ def _get_collect_atts(atts):
     Returns
     -------
     function
-        (int,int)-yields->(some_data)"""
-    atts_iter = iter(atts if atts else ())
-    pos = -1
-    data = None
+        (int,int)-returns->(list of some_data)"""
+    att_list = list(atts if atts else ())
+    count = len(att_list)
+    idx = 0
     def collect(start, end):
-        """Yields data whose pos is in interval [start, end).
-        Maintains an internal state containing attributes sorted according
+        """Returns data whose pos is in interval [start, end).
+        Maintains an index into attributes sorted according
         to their positions. Moves in this list to greater position only.
         That means that for subsequent calls the interval must also
         grow towards greater positions.
@@ -408,22 +427,49 @@ def _get_collect_atts(atts):
         end: int
             last position (exclusive)
 
-        Yields
-        ------
-        some_data"""
-        nonlocal pos
-        nonlocal data
-        theend = start + end, None # if empty string end < start
-        while pos < start:
-            pos, data = next(atts_iter, theend)
-        while pos < end:
-            yield data
-            pos, data = next(atts_iter, theend)
+        Returns
+        -------
+        list
+            some_data"""
+        nonlocal idx
+        while idx < count and att_list[idx][0] < start:
+            idx += 1
+        first = idx
+        while idx < count and att_list[idx][0] < end:
+            idx += 1
+        return [t[1] for t in att_list[first:idx]]
     return collect
 
-def _merge_dicts(dicta, dictb):
-    """Merges dictb into dicta if dctb exists, returns dicta otherwise."""
-    return {**dicta, **dictb} if dictb else dicta
+Node = namedtuple('Node', 'kind id neighbours atts')
+Node.__doc__ = """Node parsed from a node line. Compares equal to the
+plain tuple ('node', ID, tuple_of_adjacent_node_ids, dict_of_attributes).
+
+Parameters
+----------
+kind: str
+    'node'
+id: str
+    ID of node
+neighbours: tuple
+    str, IDs of adjacent nodes
+atts: dict
+    str=>str, attributes
+"""
+
+Edge = namedtuple('Edge', 'kind pair atts')
+Edge.__doc__ = """Edge between two adjacent nodes. Compares equal to the
+plain tuple ('edge', (ID_of_left_node, ID_of_right_node),
+dict_of_attributes).
+
+Parameters
+----------
+kind: str
+    'edge'
+pair: tuple
+    str, str (ID_of_left_node, ID_of_right_node)
+atts: dict
+    str=>str, attributes
+"""
 
 def _add_atts(sorted_entities, sorted_atts):
     """Adds attributes having suitable position to entities (nodes/edges).
@@ -438,14 +484,17 @@ def _add_atts(sorted_entities, sorted_atts):
 
     Yields
     ------
-    tuple
-        ...
-        * dict of attributes"""
+    Node|Edge"""
     atts = _get_collect_atts(sorted_atts)
     if sorted_entities:
         for e in sorted_entities:
             start, end = e[0]
-            yield *e[1:], reduce(_merge_dicts, atts(start, end), _empty_dict)
+            acc = {}
+            for d in atts(start, end):
+                if d:
+                    acc.update(d)
+            cls_ = Node if e[1] == 'node' else Edge
+            yield cls_(*e[1:], acc if acc else _empty_dict)
 
 _get_start = itemgetter(0)
 
@@ -519,7 +568,9 @@ def parse_graph(textlines):
     Returns
     -------
     collections.abc.Iterable
-        * tuple (either 'node', 'edge', or 'comment'), all values are strings:
+        * tuple (either 'node', 'edge', or 'comment'), all values are strings,
+          nodes and edges are instances of the namedtuples Node/Edge which
+          compare equal to the plain tuples:
             * 'node':
                 * ('node',
                   ID,
@@ -536,19 +587,12 @@ def parse_graph(textlines):
     Raises
     ------
     ValueError"""
-    def _pieces(entity_atts):
-        """subfunction"""
-        entities = entity_atts.get('entities', _empty_tuple)
-        atts = entity_atts.get('atts', _empty_tuple)
-        if entities or atts:
+    for entities, payload, row in _scanlines(textlines):
+        if entities:
             yield from _add_atts(
-                _insert_edges(entities), sorted(atts, key=_get_start))
+                _insert_edges(entities), merge(*payload, key=_get_start))
         else:
-            comment = entity_atts.get('comment')
-            if comment:
-                yield 'comment', comment, entity_atts['row']
-    return chain.from_iterable(
-        _pieces(entity_atts) for entity_atts in _scanlines(textlines))
+            yield 'comment', payload, row
 
 def parse(strings):
     """Parses multiline strings of graph data. More help is available at
@@ -578,7 +622,9 @@ def parse(strings):
     Raises
     ------
     ValueError"""
-    return parse_graph(l for s in strings for l in s.split('\n'))
+    # StringIO yields lines lazily (trailing newlines are non-word
+    # characters and do not influence categories or positions)
+    return parse_graph(l for s in strings for l in StringIO(s))
 
 def parse_positions(textlines):
     """Extracts nodes and positions of their first characters from iterable
@@ -605,6 +651,41 @@ def parse_positions(textlines):
 
 _sides = set(('l', 'r'))
 
+@lru_cache(maxsize=512)
+def _disconnect_pattern(devid, side, nodeid):
+    """Compiles the search pattern and builds the replacement template
+    used by function 'disconnect'. Results are cached as 'cuts' calls
+    'disconnect' with identical arguments repeatedly.
+
+    Parameters
+    ----------
+    devid: str
+        ID of node to disconnect
+    side: 'l'|'r'
+        side of node to be disconnected
+    nodeid: str
+        ID of new helper node to insert
+
+    Returns
+    -------
+    tuple
+        * re.Pattern
+        * str, replacement template"""
+    devid_ = re.escape(devid)
+    if side == 'l':
+        subs = f'_{nodeid}'
+        length = 1 + len(subs)
+        pattern, replacement = (
+            f'(?P<PRE>\w)([\s\W]{{{length}}})(?P<ID>[\s\W]+{devid_})',
+            r'\g<PRE> ' + subs + r'\g<ID>')
+    else:
+        subs = f'{nodeid}_'
+        length = 1 + len(subs)
+        pattern, replacement = (
+            f'(?P<ID>{devid_}[\s\W]+)([\s\W]{{{length}}})(?P<POST>\w)',
+            r'\g<ID>' + subs + r' \g<POST>')
+    return re.compile(pattern, re.MULTILINE), replacement
+
 def disconnect(schema='', devid='', side='r', nodeid='n'):
     """Helper function for manipulation of schema before parsing.
     Inserts an additional node with leading/trailing '_' character to the
@@ -628,26 +709,11 @@ def disconnect(schema='', devid='', side='r', nodeid='n'):
     Returns
     -------
     str"""
-    assert side in set(_sides)
-    if side == 'l':
-        subs = f'_{nodeid}'
-        length = 1 + len(subs)
-        pattern, replacement = (
-            f'(?P<PRE>\w)([\s\W]{{{length}}})(?P<ID>[\s\W]+{devid})',
-            r'\g<PRE> ' + subs + r'\g<ID>')
-    else:
-        subs = f'{nodeid}_'
-        length = 1 + len(subs)
-        pattern, replacement = (
-            f'(?P<ID>{devid}[\s\W]+)([\s\W]{{{length}}})(?P<POST>\w)',
-            r'\g<ID>' + subs + r' \g<POST>')
-    expr = re.compile(pattern, re.MULTILINE)
+    assert side in _sides
+    expr, replacement = _disconnect_pattern(devid, side, nodeid)
     m = expr.search(schema)
     if m:
-        start = m.string[:m.start()]
-        subs = m.expand(replacement)
-        end = m.string[m.end():]
-        return f"{start}{subs}{end}"
+        return schema[:m.start()] + m.expand(replacement) + schema[m.end():]
     return None
 
 def cut(schema='', devid='', side='', nodeid='n'):
@@ -736,7 +802,7 @@ _tuple_parsing_states = {
             '(?P<vb>[\.\-+\w]+)|'
             '(?P<v2b>(?P<qu>"|\').*?(?P=qu))|'
             '(?P<_w>\()|'
-            '(?P<Fv>[^"\'\(\.\-+\w])'),
+            '(?P<Fv>[^\(\.\-+\w])'),
     # after attribute
     'b': re.compile(
             # comma or white space separate attributes
@@ -750,7 +816,7 @@ _tuple_parsing_states = {
             '(?P<_w>\s+)|'
             '(?P<vx>[\.\-+\w]+)|'
             '(?P<v2x>(?P<qu>"|\').*?(?P=qu))|'
-            '(?P<Fw>[^\.\-+\w\'\s"]+)'),
+            '(?P<Fw>[^\.\-+\w\s]+)'),
     # after values of attribute
     'x': re.compile(
             # consume all white spaces up to one
@@ -778,8 +844,8 @@ def _tokenize(text, states=_tuple_parsing_states, start_state='e'):
     states: dict
         optional, default _tuple_parsing_states
         str=>re.Pattern, the key is just one character,
-        re.Pattern.search must in any case produce a match with an arbitrary
-        string, the first character of the match group is the type
+        re.Pattern.match must in any case produce a match at an arbitrary
+        position, the first character of the match group is the type
         of the issued token, the last character is the new state which
         is the key for the next regular expression
     start_state: str
@@ -795,31 +861,42 @@ def _tokenize(text, states=_tuple_parsing_states, start_state='e'):
         * int, index of parsed row
         * int, index of parsed column, start
         * int, index of parsed column, end"""
+    # local binding, _Token is referenced once per token and error
+    token_ = _Token
     state = start_state
+    pattern = states.get(state)
     for row, text_line in enumerate(text):
         start = 0
         end = len(text_line)
         while start < end:
-            pattern = states.get(state)
             if pattern is None:
                 msg = f'unknown state \'{state}\' reached'
-                yield _Token('E', msg, text_line, row, start, start+1)
+                yield token_('E', msg, text_line, row, start, start+1)
                 return
-            m = pattern.search(text_line, start)
+            m = pattern.match(text_line, start)
             if m:
-                try:
-                    k, v = next(kv for kv in m.groupdict().items() if kv[1])
-                except StopIteration:
+                k = m.lastgroup
+                if k is None:
                     msg = f'no match in state \'{state}\''
-                    yield _Token('E', msg, text_line, row, start, start+1)
+                    yield token_('E', msg, text_line, row, start, start+1)
                     return
+                type_ = k[0]
+                v = m.group(k)
+                if type_ == 'e' or type_ == 'a':
+                    # element and attribute names repeat across the
+                    # input and end up as dict keys, interning turns
+                    # those lookups into identity comparisons
+                    v = intern(v)
                 column_startstop = m.span()
-                yield _Token(k[0], v, text_line, row, *column_startstop)
-                state = k[-1]
+                yield token_(type_, v, text_line, row, *column_startstop)
+                newstate = k[-1]
+                if newstate != state:
+                    state = newstate
+                    pattern = states.get(state)
                 start = column_startstop[1]
             else:
                 msg = f'no match in state \'{state}\''
-                yield _Token('E', msg, text_line, row, start, start+1)
+                yield token_('E', msg, text_line, row, start, start+1)
                 return
 
 # collecting tokens
@@ -888,9 +965,9 @@ def _get_position_hint(token):
     start = token.start
     prefix = f'{token.row}:{start}:'
     row_len = len(prefix)
-    return '\n'.join(
-        [f'{prefix}{token.text}',
-         f'{" "*row_len}{"-"*start}{"^"*(token.end-start)}'])
+    return (
+        f'{prefix}{token.text}\n'
+        f'{" "*row_len}{"-"*start}{"^"*(token.end-start)}')
 
 def _message_collection(text, token):
     """Creates a Tokencollection for an error message of level==2.
@@ -906,12 +983,8 @@ def _message_collection(text, token):
     Tokencollection"""
     return _Tokencollection(
         name = _Token(
-            type=token.type,
-            content='Message',
-            text=token.text,
-            row=token.row,
-            start=token.start,
-            end=token.end),
+            token.type, 'Message', token.text,
+            token.row, token.start, token.end),
         attributes=[
             _Attributetokens(
                 name = _Token(
@@ -930,21 +1003,21 @@ def _message_collection(text, token):
 
 def _error(context, token):
     """Creates an instance of _Tokencollection from error tokens"""
-    text = '\n'.join([token.content, _get_position_hint(token)])
+    text = f'{token.content}\n{_get_position_hint(token)}'
     return context, _message_collection(text, token), True
 
 def _invalid_character_error(context, token):
     """Creates an instance of _Tokencollection from error tokens"""
     plural = '' if token.end-token.start < 2 else 's'
-    text = '\n'.join(
-        [f'error: invalid character{plural} \'{token.content}\'',
-         _get_position_hint(token)])
+    text = (
+        f'error: invalid character{plural} \'{token.content}\'\n'
+        f'{_get_position_hint(token)}')
     return context, _message_collection(text, token), True
 
 def _invalid_token_error(context, token):
-    text = '\n'.join(
-        [f'error: invalid text \'{token.content}\'',
-         _get_position_hint(token)])
+    text = (
+        f'error: invalid text \'{token.content}\'\n'
+        f'{_get_position_hint(token)}')
     return context, _message_collection(text, token), True
 
 _unexpected_end_of_stream_error = _Tokencollection(
@@ -1012,7 +1085,7 @@ _transitions = ({
      'C':(_empty_tuple, '_')},
     ((_invalid_token_error,), '_')))
 
-_close = [_Token('C')]
+_close_token = _Token('C')
 
 def _collect_tokens(tokens, transitions=_transitions):
     """Creates a stream of _Tokencollection instances from a stream of
@@ -1030,16 +1103,32 @@ def _collect_tokens(tokens, transitions=_transitions):
     _Tokencollection"""
     states, default_transitions = transitions
     trans_dict, default_trans = default_transitions
+    current_key = '_'
     context = None
-    for t in chain(tokens, _close):
-        actions, state_key = trans_dict.get(t.type, default_trans)
+    for t in tokens:
+        # t[0] is t.type, plain tuple indexing skips the namedtuple
+        # field descriptor on the per-token dispatch
+        actions, state_key = trans_dict.get(t[0], default_trans)
         for action in actions:
             context, collection, continue_ = action(context, t)
             if collection:
                 yield collection
             if not continue_:
                 return
-        trans_dict, default_trans = states.get(state_key, default_transitions)
+        if state_key != current_key:
+            current_key = state_key
+            trans_dict, default_trans = states.get(
+                state_key, default_transitions)
+    # end of stream, apply the close token ('C') to the final state,
+    # handled after the loop instead of chaining it onto the token
+    # stream which would add one iterator indirection per token
+    actions, _ = trans_dict.get('C', default_trans)
+    for action in actions:
+        context, collection, continue_ = action(context, _close_token)
+        if collection:
+            yield collection
+        if not continue_:
+            return
 
 def _parse_params(text_lines):
     """Parses a multiline text.
@@ -1094,12 +1183,37 @@ def _convert_values(cls_, value_tokens):
         try:
             yield cls_(token.content)
         except ValueError as e:
-            text = '\n'.join(
-                [str(e),
-                 f'\'{token.content}\' cannot be converted to {cls_.__name__}',
-                 _get_position_hint(token)])
+            text = (
+                f'{e}\n'
+                f'\'{token.content}\' cannot be converted to {cls_.__name__}\n'
+                f'{_get_position_hint(token)}')
             raise ValueError(text)
 
+@lru_cache(maxsize=128)
+def _get_value_converter(cls_, is_tuple):
+    """Creates a function converting the value tokens of one attribute
+    with cls_. Converters are cached per (cls_, is_tuple) as 'make_objects'
+    converts many attributes sharing few distinct types.
+
+    Parameters
+    ----------
+    cls_: callable
+        unary function for data conversion e.g. int, str, bool
+    is_tuple: bool
+        attribute accepts multiple values
+
+    Returns
+    -------
+    function
+        (iterable of _Token) -> (tuple of cls_ | cls_)"""
+    if is_tuple:
+        def convert(value_tokens):
+            return tuple(_convert_values(cls_, value_tokens))
+    else:
+        def convert(value_tokens):
+            return tuple(_convert_values(cls_, value_tokens))[0]
+    return convert
+
 def _convert_att(att_tokens, att_descr):
     """Converts tokens of one attribute two accepted type.
 
@@ -1117,23 +1231,26 @@ def _convert_att(att_tokens, att_descr):
         * str|None, attribute name
         * type according to att_descr|tuple|None, value(s)"""
     att_name = att_tokens.name.content
-    try:
-        cls_, is_tuple = att_descr[att_name]
-    except KeyError:
-        text = '\n'.join(
-            [f'error: invalid name for attribute \'{att_name}\'',
-             _get_position_hint(att_tokens.name)])
+    # .get with a None check is cheaper than try/except KeyError when
+    # unknown attribute names are a realistic input
+    descr = att_descr.get(att_name)
+    if descr is None:
+        text = (
+            f'error: invalid name for attribute \'{att_name}\'\n'
+            f'{_get_position_hint(att_tokens.name)}')
         return text, None, None
+    cls_, is_tuple = descr
     value_tokens = att_tokens.values
-    if 1 < len(value_tokens) and not is_tuple:
+    # test the already-loaded flag first, len() only runs for scalars
+    if not is_tuple and 1 < len(value_tokens):
         second_value_token = value_tokens[1]
-        text = '\n'.join(
-            [f'just one value is accepted for \'{att_name}\'',
-             _get_position_hint(second_value_token)])
+        text = (
+            f'just one value is accepted for \'{att_name}\'\n'
+            f'{_get_position_hint(second_value_token)}')
         return text, None, None
     try:
-        values = tuple(_convert_values(cls_, value_tokens))
-        return None, att_name, values if is_tuple else values[0]
+        return (
+            None, att_name, _get_value_converter(cls_, is_tuple)(value_tokens))
     except ValueError as ve:
         return str(ve), None, None
 
@@ -1171,13 +1288,12 @@ def _make_object(type_data, msg_factory, token_collection):
                 # create object
                 return cls_(**att_dict)
             except Exception as ex:
-                text = '\n'.join(
-                    [str(ex), _get_position_hint(token_collection.name)])
+                text = f'{ex}\n{_get_position_hint(token_collection.name)}'
                 return msg_factory(text, 2)
     else:
-        text = '\n'.join(
-            [f'unknown element \'{name_content}\'',
-             _get_position_hint(token_collection.name)])
+        text = (
+            f'unknown element \'{name_content}\'\n'
+            f'{_get_position_hint(token_collection.name)}')
         return msg_factory(text, 2)
 
 def make_objects(type_data, msg_factory, text_lines):
@@ -1209,8 +1325,10 @@ def make_objects(type_data, msg_factory, text_lines):
     -------
     iterable
         objects"""
-    return (_make_object(type_data, msg_factory, t)
-            for t in _parse_params(text_lines))
+    # local binding avoids a global lookup per yielded object
+    make_object = _make_object
+    for t in _parse_params(text_lines):
+        yield make_object(type_data, msg_factory, t)
 
 def make_type_data(meta):
     """Creates a dictionary
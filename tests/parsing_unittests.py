@@ -42,6 +42,18 @@ class Scanoneline(unittest.TestCase):
         self.assertEqual(cat, 'a')
         self.assertEqual(list(s)[0][1], {'a.b': '42'})
 
+    def test_cached(self):
+        _scanoneline.cache_clear()
+        first = _scanoneline('my_node   my_node2')
+        second = _scanoneline('my_node   my_node2')
+        self.assertEqual(first, second)
+        self.assertEqual(_scanoneline.cache_info().hits, 1)
+
+    def test_attribute3(self):
+        cat, s = _scanoneline('a2=-4.2e+1,b=x')
+        self.assertEqual(cat, 'a')
+        self.assertEqual(list(s)[0][1], {'a2': '-4.2e+1', 'b': 'x'})
+
 class Parse(unittest.TestCase):
 
     def test_1_node(self):
@@ -120,6 +132,12 @@ class Parse(unittest.TestCase):
         ex = [('comment', d, 0)]
         self.assertEqual([*parse([d])], ex, f"expected {ex}")
 
+    def test_comment_multiline(self):
+        """comment payload carries no line terminator"""
+        d = '# this is a comment\nn0'
+        ex = [('comment', '# this is a comment', 0), ('node', 'n0', (), {})]
+        self.assertEqual([*parse([d])], ex, f"expected {ex}")
+
     def test_ignored_att(self):
         d = 'a=42'
         ex = []